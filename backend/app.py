@@ -6,29 +6,121 @@ Author: Generated with AI assistance
 License: MIT
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, stream_with_context
 from flask_cors import CORS
 import os
+import functools
+import heapq
 import pathlib
+import queue
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
 import json
 import ollama
+import orjson
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend communication
 
+
+def _json_default(obj: Any) -> Any:
+    """Serialize datetimes as ISO 8601 like orjson, defer the rest to Flask."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return app.json.default(obj)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """
+    Encode obj as JSON with orjson, falling back to Flask's JSON provider.
+
+    orjson rejects strings with lone surrogates, which is how os.scandir
+    returns filenames that aren't valid UTF-8 on Linux; the fallback
+    escapes them instead of failing the whole response.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return app.json.dumps(obj, default=_json_default).encode()
+
+
+def fastjson(obj: Any, status: int = 200):
+    """Build a JSON response with orjson (serializes datetime natively)."""
+    return app.response_class(
+        dumps_json(obj),
+        status=status,
+        mimetype='application/json'
+    )
+
 # Configuration
 BASE_PATH = os.path.expanduser("~")  # Default to user's home directory
 MAX_FILE_SIZE_DISPLAY = 100  # Maximum number of files to return
 OLLAMA_MODEL = "llama3.1:8b"  # Model with function calling support
+OLLAMA_HOST = os.environ.get('OLLAMA_HOST', 'http://127.0.0.1:11434')
+# temperature 0 keeps tool calls deterministic; num_predict only bounds runaway
+# generations and is high enough that plain chat replies are not cut off
+OLLAMA_OPTIONS = {'num_predict': 1024, 'temperature': 0}
+
+# Persistent client so the HTTP connection is reused across requests
+OLLAMA_CLIENT = ollama.Client(host=OLLAMA_HOST)
+
+# Shared pool for directory tree walks (scandir/stat release the GIL)
+WALK_EXECUTOR = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2, thread_name_prefix='walk')
+WALK_WINDOW = 8  # Max directory scans queued per walk, so concurrent walks share the pool
+
+# Background jobs started via /api/execute:
+# job id -> {'future': Future, 'events': Queue, 'finished': monotonic time or None,
+#           'streaming': True once a client has opened its stream}
+# JOBS and the 'streaming' flag are only touched with JOBS_LOCK held
+# Kept separate from WALK_EXECUTOR so a running job never waits on its own pool
+JOB_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='job')
+JOBS: Dict[str, Dict[str, Any]] = {}
+JOBS_LOCK = threading.Lock()
+JOB_LIMIT = 64  # Max jobs kept at once, running or waiting to be fetched
+JOB_TTL = 600.0  # seconds a finished job's result is kept if nobody fetches it
+
+# (path, name, size, mtime) as produced by the tree walk
+FileRecord = Tuple[str, str, int, float]
+
+# Per-directory listing cache for tree walks:
+# path -> (directory st_mtime_ns, cached at, file names, subdirectory names)
+# Only names and types are cached; files are stat'ed on every walk, and only
+# once their name matches. Capacity is counted in names so a home directory
+# tree fits. When full, new directories are left uncached instead of evicting
+# others, so repeated walks of a larger tree still hit on the part that fits.
+# A listing is not cached while its directory's mtime is within
+# DIR_CACHE_RACY_NS of the scan: on filesystems with coarse timestamps
+# (1 s on HFS+/ext3, 2 s on FAT) a later change in the same tick would leave
+# the mtime unchanged. The TTL is a backstop for anything that slips past.
+# Disabled on Windows, where scandir already returns file metadata and a
+# cache hit (one lstat per matching name) would be slower than rescanning.
+DIR_CACHE_ENABLED = os.name != 'nt'
+DIR_CACHE_MAX_NAMES = 500_000
+DIR_CACHE_TTL = 30.0  # seconds
+DIR_CACHE_RACY_NS = 2_000_000_000
+_DIR_CACHE: Dict[str, Tuple[int, float, List[str], List[str]]] = {}
+_DIR_CACHE_LOCK = threading.Lock()
+_dir_cache_names = 0  # Names currently held in _DIR_CACHE
+_dir_cache_swept_at = 0.0  # Last time expired entries were swept
+
+# Recently missing paths for list_directory/move_files: path -> time seen missing
+NEG_CACHE_SIZE = 256
+NEG_CACHE_TTL = 2.0  # seconds; short so directories created elsewhere show up quickly
+_NEG_CACHE: Dict[str, float] = {}
 
 
 class FileOperations:
     """Handle all file system operations with proper error handling."""
 
     @staticmethod
-    def find_files_by_extension(directory: str, extension: str, limit: int = 50) -> List[Dict[str, Any]]:
+    def find_files_by_extension(directory: str, extension: str, limit: int = 50,
+                                on_file: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
         """
         Find files by extension in a directory and its subdirectories.
 
@@ -36,36 +128,27 @@ class FileOperations:
             directory: Starting directory path
             extension: File extension to search for (e.g., '.py', '.txt')
             limit: Maximum number of files to return
+            on_file: Optional callback invoked with each file as it is found
 
         Returns:
             List of file information dictionaries
         """
         try:
-            files = []
+            records = []
             extension = extension if extension.startswith('.') else f'.{extension}'
 
-            for root, _, filenames in os.walk(directory):
-                for filename in filenames:
-                    if filename.endswith(extension):
-                        filepath = os.path.join(root, filename)
-                        try:
-                            stat = os.stat(filepath)
-                            files.append({
-                                'path': filepath,
-                                'name': filename,
-                                'size': stat.st_size,
-                                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                                'readable_size': FileOperations._format_size(stat.st_size)
-                            })
-                        except (OSError, PermissionError):
-                            continue
+            for record in FileOperations._iter_files(directory, extension):
+                records.append(record)
+                if on_file is not None:
+                    on_file(FileOperations._file_info(*record))
 
-                        if len(files) >= limit:
-                            break
-                if len(files) >= limit:
+                # Closing the walk here stops it from scanning any further
+                if len(records) >= limit:
                     break
 
-            return sorted(files, key=lambda x: x['modified'], reverse=True)
+            # Newest first; format only the records being returned
+            records.sort(key=itemgetter(3), reverse=True)
+            return [FileOperations._file_info(*record) for record in records]
         except Exception as e:
             raise Exception(f"Error finding files: {str(e)}")
 
@@ -82,26 +165,10 @@ class FileOperations:
             List of file information dictionaries sorted by size
         """
         try:
-            files = []
-
-            for root, _, filenames in os.walk(directory):
-                for filename in filenames:
-                    filepath = os.path.join(root, filename)
-                    try:
-                        stat = os.stat(filepath)
-                        files.append({
-                            'path': filepath,
-                            'name': filename,
-                            'size': stat.st_size,
-                            'readable_size': FileOperations._format_size(stat.st_size),
-                            'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                        })
-                    except (OSError, PermissionError):
-                        continue
+            # Keep only the top N while streaming instead of sorting every file
+            largest = heapq.nlargest(limit, FileOperations._iter_files(directory), key=itemgetter(2))
 
-            # Sort by size and return top N
-            files.sort(key=lambda x: x['size'], reverse=True)
-            return files[:limit]
+            return [FileOperations._file_info(*record) for record in largest]
         except Exception as e:
             raise Exception(f"Error getting largest files: {str(e)}")
 
@@ -128,6 +195,8 @@ class FileOperations:
                 }
 
             os.makedirs(new_path, exist_ok=False)
+            _NEG_CACHE.pop(new_path, None)
+            FileOperations._invalidate_dir(directory)
             return {
                 'success': True,
                 'message': f'Folder created successfully',
@@ -137,39 +206,72 @@ class FileOperations:
             raise Exception(f"Error creating folder: {str(e)}")
 
     @staticmethod
-    def list_directory(directory: str) -> Dict[str, Any]:
+    def list_directory(directory: str, offset: int = 0, limit: int = 200) -> Dict[str, Any]:
         """
-        List contents of a directory.
+        List contents of a directory, one page at a time.
 
         Args:
             directory: Directory path to list
+            offset: Number of sorted entries to skip
+            limit: Maximum number of entries to return
 
         Returns:
-            Dictionary with files and folders
+            Dictionary with the page of files and folders and the total count
         """
         try:
-            if not os.path.exists(directory):
+            if not FileOperations._path_exists(directory):
                 raise Exception(f"Directory does not exist: {directory}")
 
-            items = []
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                try:
-                    stat = os.stat(item_path)
-                    items.append({
-                        'name': item,
-                        'path': item_path,
-                        'is_directory': os.path.isdir(item_path),
-                        'size': stat.st_size if not os.path.isdir(item_path) else 0,
-                        'readable_size': FileOperations._format_size(stat.st_size) if not os.path.isdir(item_path) else '-',
-                        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-                    })
-                except (OSError, PermissionError):
-                    continue
+            # Collect raw (name, path, size, mtime) tuples, split into folders
+            # and files; formatting happens once the listing is sorted
+            dirs = []
+            files = []
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        # Entry vanished between readdir and stat
+                        continue
+
+                    (dirs if entry.is_dir(follow_symlinks=False) else files).append(
+                        (entry.name, entry.path, stat.st_size, stat.st_mtime)
+                    )
+
+            # Sorting each group on its name alone compares plain strings
+            # instead of (is_dir, name) tuples
+            dirs.sort(key=itemgetter(0))
+            files.sort(key=itemgetter(0))
+
+            # Slice the page (folders first, then files) before building dicts
+            offset = max(offset, 0)
+            end = offset + max(limit, 0)
+            page_dirs = dirs[offset:end]
+            page_files = files[max(offset - len(dirs), 0):max(end - len(dirs), 0)]
+
+            items = [{
+                'name': name,
+                'path': path,
+                'is_directory': True,
+                'size': 0,
+                'readable_size': '-',
+                'modified': datetime.fromtimestamp(mtime)
+            } for name, path, _, mtime in page_dirs]
+            items.extend({
+                'name': name,
+                'path': path,
+                'is_directory': False,
+                'size': size,
+                'readable_size': FileOperations._format_size(size),
+                'modified': datetime.fromtimestamp(mtime)
+            } for name, path, size, mtime in page_files)
 
             return {
                 'directory': directory,
-                'items': sorted(items, key=lambda x: (not x['is_directory'], x['name']))
+                'items': items,
+                'total': len(dirs) + len(files),
+                'offset': offset,
+                'limit': limit
             }
         except Exception as e:
             raise Exception(f"Error listing directory: {str(e)}")
@@ -182,30 +284,51 @@ class FileOperations:
         Args:
             source_directory: Directory containing files to move
             destination_directory: Directory where files should be moved
-            pattern: File pattern to match (e.g., 'Screenshot*.png', '*.txt')
+            pattern: File pattern to match (e.g., 'Screenshot*.png', '*.txt', 'shots/*.png')
 
         Returns:
             Dictionary with operation results and count of moved files
         """
         try:
-            import glob
-            import shutil
+            import fnmatch
 
             # Validate directories
-            if not os.path.exists(source_directory):
+            if not FileOperations._path_exists(source_directory):
                 raise Exception(f"Source directory does not exist: {source_directory}")
 
             if not os.path.exists(destination_directory):
                 # Create destination directory if it doesn't exist
                 os.makedirs(destination_directory, exist_ok=True)
-
-            # Build the full pattern path
-            search_pattern = os.path.join(source_directory, pattern)
-
-            # Find matching files
-            matching_files = glob.glob(search_pattern)
-
-            if not matching_files:
+                _NEG_CACHE.pop(destination_directory, None)
+
+            # Decide once whether moves can stay on the same filesystem
+            same_device = os.stat(source_directory).st_dev == os.stat(destination_directory).st_dev
+
+            if os.sep in pattern or (os.altsep and os.altsep in pattern):
+                # Patterns with a directory component (e.g. 'shots/*.png')
+                # need glob; only regular files are moved, not symlinks
+                import glob
+                matches = [
+                    (os.path.basename(path), path, None)
+                    for path in glob.glob(os.path.join(source_directory, pattern))
+                    if os.path.isfile(path) and not os.path.islink(path)
+                ]
+            else:
+                # Collect regular files in a single scandir pass (no per-file stat)
+                with os.scandir(source_directory) as it:
+                    entries = [entry for entry in it if entry.is_file(follow_symlinks=False)]
+
+                # Compile the pattern once; normcase keeps Windows matching case-insensitive
+                match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+                skip_hidden = not pattern.startswith('.')
+
+                # Find matching files; like glob, wildcards skip hidden files
+                matches = [
+                    (entry.name, entry.path, entry) for entry in entries
+                    if match(os.path.normcase(entry.name)) and not (skip_hidden and entry.name.startswith('.'))
+                ]
+
+            if not matches:
                 return {
                     'success': True,
                     'message': f'No files found matching pattern: {pattern}',
@@ -216,38 +339,40 @@ class FileOperations:
             moved_files = []
             errors = []
 
-            for source_path in matching_files:
-                # Only move files, not directories
-                if os.path.isfile(source_path):
-                    try:
-                        filename = os.path.basename(source_path)
-                        dest_path = os.path.join(destination_directory, filename)
-
-                        # Check if file already exists at destination
-                        if os.path.exists(dest_path):
-                            errors.append({
-                                'file': filename,
-                                'error': f'File already exists at destination'
-                            })
-                            continue
+            for filename, source_path, entry in matches:
+                try:
+                    dest_path = os.path.join(destination_directory, filename)
+
+                    if entry is not None:
+                        size = entry.stat(follow_symlinks=False).st_size
+                    else:
+                        size = os.lstat(source_path).st_size
+
+                    # Move the file (fails if it already exists at destination)
+                    FileOperations._move_file(source_path, dest_path, same_device)
+                    FileOperations._invalidate_dir(os.path.dirname(source_path))
+
+                    moved_files.append({
+                        'name': filename,
+                        'source': source_path,
+                        'destination': dest_path,
+                        'size': size,
+                        'readable_size': FileOperations._format_size(size)
+                    })
+                except FileExistsError:
+                    errors.append({
+                        'file': filename,
+                        'error': f'File already exists at destination'
+                    })
+                except Exception as e:
+                    errors.append({
+                        'file': filename,
+                        'error': str(e)
+                    })
 
-                        # Move the file
-                        shutil.move(source_path, dest_path)
-
-                        # Get file info
-                        stat = os.stat(dest_path)
-                        moved_files.append({
-                            'name': filename,
-                            'source': source_path,
-                            'destination': dest_path,
-                            'size': stat.st_size,
-                            'readable_size': FileOperations._format_size(stat.st_size)
-                        })
-                    except Exception as e:
-                        errors.append({
-                            'file': os.path.basename(source_path),
-                            'error': str(e)
-                        })
+            if moved_files:
+                FileOperations._invalidate_dir(source_directory)
+                FileOperations._invalidate_dir(destination_directory)
 
             result = {
                 'success': True,
@@ -268,6 +393,61 @@ class FileOperations:
         except Exception as e:
             raise Exception(f"Error moving files: {str(e)}")
 
+    @staticmethod
+    def _move_file(source_path: str, dest_path: str, same_device: bool) -> None:
+        """
+        Move a file without ever replacing an existing destination.
+
+        On the same filesystem the file is hard-linked into place and the
+        source unlinked, so the existence check and the move are one atomic
+        step (os.rename would silently overwrite on POSIX). Filesystems
+        without hard links fall back to os.rename. Across filesystems, or
+        mounts that share a device but refuse links with EXDEV, the file is
+        copied and the source removed.
+
+        Args:
+            source_path: File to move
+            dest_path: Full destination path
+            same_device: Whether source and destination share a filesystem
+
+        Raises:
+            FileExistsError: If dest_path already exists
+        """
+        import errno
+        import shutil
+
+        if same_device:
+            try:
+                os.link(source_path, dest_path)
+            except FileExistsError:
+                raise
+            except OSError as e:
+                # EXDEV despite a shared st_dev (bind mounts, container
+                # volumes) falls through to the copy below
+                if e.errno != errno.EXDEV:
+                    # Hard links not supported here (e.g. FAT/exFAT volumes)
+                    if os.path.lexists(dest_path):
+                        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dest_path)
+                    try:
+                        os.rename(source_path, dest_path)
+                        return
+                    except OSError as rename_error:
+                        if rename_error.errno != errno.EXDEV:
+                            raise
+            else:
+                try:
+                    os.unlink(source_path)
+                except OSError:
+                    # Leave the file where it was rather than in both places
+                    os.unlink(dest_path)
+                    raise
+                return
+
+        if os.path.lexists(dest_path):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dest_path)
+        shutil.copy2(source_path, dest_path)
+        os.unlink(source_path)
+
     @staticmethod
     def find_duplicates(directory: str, min_size: int = 102400) -> Dict[str, Any]:
         """
@@ -295,24 +475,17 @@ class FileOperations:
 
             print(f"Scanning {directory} for files...")
 
-            for root, _, filenames in os.walk(directory):
-                for filename in filenames:
-                    filepath = os.path.join(root, filename)
-                    try:
-                        if os.path.isfile(filepath):
-                            total_files += 1
-                            stat = os.stat(filepath)
-                            file_size = stat.st_size
-
-                            # Skip files smaller than min_size
-                            if file_size < min_size:
-                                skipped_small += 1
-                                continue
+            # Symlinks are not followed, so a link is never reported as a
+            # duplicate of its own target
+            for filepath, filename, file_size, mtime in FileOperations._iter_files(directory):
+                total_files += 1
 
-                            size_groups[file_size].append(filepath)
+                # Skip files smaller than min_size
+                if file_size < min_size:
+                    skipped_small += 1
+                    continue
 
-                    except (OSError, PermissionError):
-                        continue
+                size_groups[file_size].append((filepath, filename, mtime))
 
             # Second pass: Hash files that have the same size
             hash_groups = defaultdict(list)
@@ -320,10 +493,10 @@ class FileOperations:
 
             print(f"Hashing files with duplicate sizes...")
 
-            for size, filepaths in size_groups.items():
+            for size, candidates in size_groups.items():
                 # Only hash if there are multiple files with the same size
-                if len(filepaths) > 1:
-                    for filepath in filepaths:
+                if len(candidates) > 1:
+                    for filepath, filename, mtime in candidates:
                         try:
                             # Calculate SHA256 hash
                             file_hash = FileOperations._hash_file(filepath)
@@ -331,10 +504,10 @@ class FileOperations:
 
                             hash_groups[file_hash].append({
                                 'path': filepath,
-                                'name': os.path.basename(filepath),
+                                'name': filename,
                                 'size': size,
                                 'readable_size': FileOperations._format_size(size),
-                                'modified': datetime.fromtimestamp(os.path.getmtime(filepath)).isoformat()
+                                'modified': datetime.fromtimestamp(mtime)
                             })
 
                         except Exception as e:
@@ -394,6 +567,255 @@ class FileOperations:
         except Exception as e:
             raise Exception(f"Error finding duplicates: {str(e)}")
 
+    @staticmethod
+    def _file_info(path: str, name: str, size: int, mtime: float) -> Dict[str, Any]:
+        """Build the file information dictionary for a walk record."""
+        return {
+            'path': path,
+            'name': name,
+            'size': size,
+            'readable_size': FileOperations._format_size(size),
+            'modified': datetime.fromtimestamp(mtime)
+        }
+
+    @staticmethod
+    def _iter_files(directory: str, suffix: str = '') -> Iterator[FileRecord]:
+        """
+        Walk a directory tree in parallel, yielding regular files.
+
+        Each directory is scanned by a worker in WALK_EXECUTOR; subdirectories
+        found by a worker are submitted back to the pool from this generator.
+        At most WALK_WINDOW scans per walk are queued at once, so a walk over
+        a large tree cannot starve walks started by other requests.
+        Symlinks are not followed and unreadable directories are skipped.
+        Pending scans are abandoned as soon as the caller stops iterating.
+
+        Args:
+            directory: Starting directory path
+            suffix: Only yield files whose name ends with this suffix
+
+        Yields:
+            (path, name, size, mtime) tuples, in no particular order
+        """
+        completed = queue.Queue()
+        stop = threading.Event()
+
+        def submit(path: str) -> None:
+            future = WALK_EXECUTOR.submit(FileOperations._scan_dir, path, suffix, stop)
+            future.add_done_callback(completed.put)
+
+        # Directories found but not yet submitted, scanned depth-first
+        backlog = [directory]
+        in_flight = 0
+        try:
+            while backlog or in_flight:
+                while backlog and in_flight < WALK_WINDOW:
+                    submit(backlog.pop())
+                    in_flight += 1
+
+                files, subdirs = completed.get().result()
+                in_flight -= 1
+                backlog.extend(subdirs)
+
+                yield from files
+        finally:
+            stop.set()
+
+    @staticmethod
+    def _scan_dir(directory: str, suffix: str, stop: threading.Event) -> Tuple[List[FileRecord], List[str]]:
+        """
+        Scan a single directory for the parallel walk in _iter_files.
+
+        Uses the cached listing when the directory is unchanged (POSIX only,
+        see DIR_CACHE_ENABLED); either way only files whose name ends with
+        suffix are stat'ed.
+
+        Args:
+            directory: Directory path to scan
+            suffix: Only return files whose name ends with this suffix
+            stop: Set once the walk is abandoned; the scan returns early
+
+        Returns:
+            Tuple of (matching file records, subdirectory paths)
+        """
+        if stop.is_set():
+            return [], []
+
+        if not DIR_CACHE_ENABLED:
+            return FileOperations._scan_and_cache(directory, None, suffix, stop)
+
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return [], []
+
+        cached = FileOperations._cached_listing(directory, mtime_ns)
+        if cached is None:
+            return FileOperations._scan_and_cache(directory, mtime_ns, suffix, stop)
+
+        file_names, subdir_names = cached
+        files = []
+        for name in file_names:
+            if name.endswith(suffix):
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.lstat(path)
+                except OSError:
+                    # File removed since the listing was cached
+                    continue
+                files.append((path, name, stat.st_size, stat.st_mtime))
+
+        return files, [os.path.join(directory, name) for name in subdir_names]
+
+    @staticmethod
+    def _scan_and_cache(directory: str, mtime_ns: Optional[int], suffix: str,
+                        stop: threading.Event) -> Tuple[List[FileRecord], List[str]]:
+        """
+        Scan a directory with os.scandir and cache its names for later walks.
+
+        Partial scans (stopped walks, unreadable directories, readdir errors)
+        are never cached.
+
+        Args:
+            directory: Directory path to scan
+            mtime_ns: The directory's st_mtime_ns, read before scanning,
+                or None to scan without caching
+            suffix: Only return files whose name ends with this suffix
+            stop: Set once the walk is abandoned; the scan returns early
+
+        Returns:
+            Tuple of (matching file records, subdirectory paths)
+        """
+        files = []
+        subdirs = []
+        file_names = []
+        subdir_names = []
+
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if stop.is_set():
+                        return files, subdirs
+                    if entry.is_dir(follow_symlinks=False):
+                        subdir_names.append(entry.name)
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        file_names.append(entry.name)
+                        # Check the name before paying for a stat
+                        if not entry.name.endswith(suffix):
+                            continue
+                        try:
+                            stat = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            # File vanished between readdir and stat
+                            continue
+                        files.append((entry.path, entry.name, stat.st_size, stat.st_mtime))
+        except OSError:
+            # Unreadable directory or a readdir error: partial, so not cached
+            return files, subdirs
+
+        if mtime_ns is not None:
+            FileOperations._store_listing(directory, mtime_ns, file_names, subdir_names)
+        return files, subdirs
+
+    @staticmethod
+    def _cached_listing(directory: str, mtime_ns: int) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Look up a directory's cached (file names, subdirectory names).
+
+        Returns None, dropping any stale entry, unless the cached listing was
+        taken at the same st_mtime_ns and is younger than DIR_CACHE_TTL.
+        Callers must not modify the returned lists.
+        """
+        with _DIR_CACHE_LOCK:
+            cached = _DIR_CACHE.get(directory)
+
+        if cached is None:
+            return None
+
+        if cached[0] != mtime_ns or time.monotonic() - cached[1] >= DIR_CACHE_TTL:
+            FileOperations._invalidate_dir(directory)
+            return None
+
+        return cached[2], cached[3]
+
+    @staticmethod
+    def _store_listing(directory: str, mtime_ns: int, file_names: List[str], subdir_names: List[str]) -> None:
+        """
+        Cache a directory listing if it fits within DIR_CACHE_MAX_NAMES.
+
+        Listings whose directory changed within DIR_CACHE_RACY_NS of now are
+        skipped, since a further change in the same timestamp tick would not
+        move the mtime. When the cache is full, expired entries are swept (at most every few
+        seconds); if there is still no room the listing is not cached.
+        """
+        global _dir_cache_names, _dir_cache_swept_at
+
+        # Also covers mtimes in the future from clock skew
+        if time.time_ns() - mtime_ns < DIR_CACHE_RACY_NS:
+            return
+
+        cost = 1 + len(file_names) + len(subdir_names)
+        now = time.monotonic()
+
+        with _DIR_CACHE_LOCK:
+            old = _DIR_CACHE.pop(directory, None)
+            if old is not None:
+                _dir_cache_names -= 1 + len(old[2]) + len(old[3])
+
+            if _dir_cache_names + cost > DIR_CACHE_MAX_NAMES and now - _dir_cache_swept_at > 5.0:
+                _dir_cache_swept_at = now
+                for path, cached in list(_DIR_CACHE.items()):
+                    if now - cached[1] >= DIR_CACHE_TTL:
+                        del _DIR_CACHE[path]
+                        _dir_cache_names -= 1 + len(cached[2]) + len(cached[3])
+
+            if _dir_cache_names + cost > DIR_CACHE_MAX_NAMES:
+                return
+
+            _DIR_CACHE[directory] = (mtime_ns, now, file_names, subdir_names)
+            _dir_cache_names += cost
+
+    @staticmethod
+    def _path_exists(path: str) -> bool:
+        """
+        os.path.exists with a short-lived cache of missing paths.
+
+        Retries of a wrong path (e.g. a directory the LLM guessed) within
+        NEG_CACHE_TTL seconds are answered without a stat.
+        """
+        if time.monotonic() - _NEG_CACHE.get(path, float('-inf')) < NEG_CACHE_TTL:
+            return False
+
+        if os.path.exists(path):
+            _NEG_CACHE.pop(path, None)
+            return True
+
+        if len(_NEG_CACHE) >= NEG_CACHE_SIZE:
+            _NEG_CACHE.clear()
+        _NEG_CACHE[path] = time.monotonic()
+        return False
+
+    @staticmethod
+    def _invalidate_dir(directory: str) -> None:
+        """Drop a directory's cached listing after modifying it."""
+        global _dir_cache_names
+
+        with _DIR_CACHE_LOCK:
+            for path in {directory, os.path.normpath(directory)}:
+                cached = _DIR_CACHE.pop(path, None)
+                if cached is not None:
+                    _dir_cache_names -= 1 + len(cached[2]) + len(cached[3])
+
+    @staticmethod
+    def _clear_dir_cache() -> None:
+        """Drop every cached directory listing."""
+        global _dir_cache_names
+
+        with _DIR_CACHE_LOCK:
+            _DIR_CACHE.clear()
+            _dir_cache_names = 0
+
     @staticmethod
     def _hash_file(filepath: str, block_size: int = 65536) -> str:
         """
@@ -419,14 +841,29 @@ class FileOperations:
 
         return sha256.hexdigest()
 
+    _SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
     @staticmethod
     def _format_size(bytes_size: int) -> str:
         """Convert bytes to human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.2f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.2f} PB"
+        bytes_size = int(bytes_size)
+        if bytes_size <= 0:
+            return "0.00 B"
+        # Each unit is 2**10 larger, so the bit length picks the unit directly
+        index = min((bytes_size.bit_length() - 1) // 10, 5)
+        return f"{bytes_size / (1 << (index * 10)):.2f} {FileOperations._SIZE_UNITS[index]}"
+
+
+class ChatReply(Exception):
+    """Raised when the LLM answers with plain text instead of a tool call."""
+
+    def __init__(self, content: str):
+        super().__init__(content)
+        self.content = content
+
+
+class UnknownActionError(Exception):
+    """Raised when /api/execute receives an action it does not know."""
 
 
 class AgentProcessor:
@@ -519,6 +956,16 @@ class AgentProcessor:
                         'directory': {
                             'type': 'string',
                             'description': 'The directory path to list. Use the user home directory if not specified.'
+                        },
+                        'offset': {
+                            'type': 'integer',
+                            'description': 'Number of entries to skip, for showing later pages. Default is 0.',
+                            'default': 0
+                        },
+                        'limit': {
+                            'type': 'integer',
+                            'description': 'Maximum number of entries to return. Default is 200.',
+                            'default': 200
                         }
                     },
                     'required': []
@@ -543,7 +990,7 @@ class AgentProcessor:
                         },
                         'pattern': {
                             'type': 'string',
-                            'description': 'The file pattern to match (e.g., "Screenshot*.png", "*.txt", "report_*.pdf"). Uses glob pattern syntax.'
+                            'description': 'The file pattern to match (e.g., "Screenshot*.png", "*.txt", "report_*.pdf"). Uses glob pattern syntax and may include a subdirectory of the source directory (e.g., "shots/*.png").'
                         }
                     },
                     'required': ['source_directory', 'destination_directory', 'pattern']
@@ -574,6 +1021,16 @@ class AgentProcessor:
         }
     ]
 
+    # Tool schemas validated into ollama.Tool models once, instead of the
+    # client re-validating the dicts on every chat call
+    OLLAMA_TOOLS = [ollama.Tool.model_validate(tool) for tool in TOOLS]
+
+    SYSTEM_PROMPT_TEMPLATE = """You are a helpful file system assistant.
+The user's current directory is: {directory}
+When a directory is not specified by the user, use this current directory.
+Always use function calling to respond to file operation requests.
+Be helpful and interpret user requests intelligently."""
+
     @staticmethod
     def process_query(query: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -591,57 +1048,42 @@ class AgentProcessor:
             context = {'directory': BASE_PATH}
 
         try:
-            # Create system message with context
-            system_message = f"""You are a helpful file system assistant.
-The user's current directory is: {context.get('directory', BASE_PATH)}
-When a directory is not specified by the user, use this current directory.
-Always use function calling to respond to file operation requests.
-Be helpful and interpret user requests intelligently."""
-
-            # Call Ollama with function calling
-            response = ollama.chat(
-                model=OLLAMA_MODEL,
-                messages=[
-                    {'role': 'system', 'content': system_message},
-                    {'role': 'user', 'content': query}
-                ],
-                tools=AgentProcessor.TOOLS
-            )
-
-            # Check if the model wants to call a function
-            if response.get('message', {}).get('tool_calls'):
-                tool_call = response['message']['tool_calls'][0]
-                function_name = tool_call['function']['name']
-                function_args = tool_call['function']['arguments']
-
-                # Map function names to actions and ensure directory is set
-                action_map = {
-                    'find_files_by_extension': 'find_by_extension',
-                    'get_largest_files': 'largest_files',
-                    'create_folder': 'create_folder',
-                    'list_directory': 'list_directory',
-                    'move_files': 'move_files',
-                    'find_duplicates': 'find_duplicates'
+            try:
+                function_name, arg_items = AgentProcessor._resolve_tool_call(
+                    query, context.get('directory', BASE_PATH)
+                )
+            except ChatReply as reply:
+                # If no function call, return help message
+                return {
+                    'action': 'help',
+                    'params': {},
+                    'llm_response': reply.content
                 }
 
-                action = action_map.get(function_name)
-                if not action:
-                    raise Exception(f"Unknown function: {function_name}")
+            # Rebuild a fresh dict so the cached arguments are never mutated
+            function_args = dict(arg_items)
+
+            # Map function names to actions and ensure directory is set
+            action_map = {
+                'find_files_by_extension': 'find_by_extension',
+                'get_largest_files': 'largest_files',
+                'create_folder': 'create_folder',
+                'list_directory': 'list_directory',
+                'move_files': 'move_files',
+                'find_duplicates': 'find_duplicates'
+            }
 
-                # Ensure directory is set if not provided
-                if 'directory' not in function_args or not function_args['directory']:
-                    function_args['directory'] = context.get('directory', BASE_PATH)
+            action = action_map.get(function_name)
+            if not action:
+                raise Exception(f"Unknown function: {function_name}")
 
-                return {
-                    'action': action,
-                    'params': function_args
-                }
+            # Ensure directory is set if not provided
+            if 'directory' not in function_args or not function_args['directory']:
+                function_args['directory'] = context.get('directory', BASE_PATH)
 
-            # If no function call, return help message
             return {
-                'action': 'help',
-                'params': {},
-                'llm_response': response.get('message', {}).get('content', 'I can help you with file operations!')
+                'action': action,
+                'params': function_args
             }
 
         except Exception as e:
@@ -653,6 +1095,44 @@ Be helpful and interpret user requests intelligently."""
                 'error': str(e)
             }
 
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _resolve_tool_call(query: str, directory: str) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+        """
+        Ask the LLM which tool to call for a query in a directory.
+
+        Results are memoized per (query, directory). Plain chat replies are
+        raised as ChatReply instead of returned, so they are never cached.
+
+        Args:
+            query: Natural language query from user
+            directory: The user's current directory
+
+        Returns:
+            Tuple of (function name, sorted argument items)
+        """
+        # Create system message with context
+        system_message = AgentProcessor.SYSTEM_PROMPT_TEMPLATE.format(directory=directory)
+
+        # Call Ollama with function calling
+        response = OLLAMA_CLIENT.chat(
+            model=OLLAMA_MODEL,
+            messages=[
+                {'role': 'system', 'content': system_message},
+                {'role': 'user', 'content': query}
+            ],
+            tools=AgentProcessor.OLLAMA_TOOLS,
+            options=OLLAMA_OPTIONS
+        )
+
+        # Check if the model wants to call a function
+        if not response.get('message', {}).get('tool_calls'):
+            raise ChatReply(response.get('message', {}).get('content', 'I can help you with file operations!'))
+
+        tool_call = response['message']['tool_calls'][0]
+        function_args = dict(tool_call['function']['arguments'])
+        return tool_call['function']['name'], tuple(sorted(function_args.items()))
+
 
 # ============ API ENDPOINTS ============
 
@@ -678,9 +1158,9 @@ def chat():
         data = request.get_json()
 
         if not data or 'message' not in data:
-            return jsonify({
+            return fastjson({
                 'error': 'Missing message in request body'
-            }), 400
+            }, 400)
 
         message = data['message']
         context = data.get('context', {'directory': BASE_PATH})
@@ -694,22 +1174,131 @@ def chat():
             help_text = action_info.get('llm_response',
                 "I can help you with file operations! Try asking me to:\n• Find files by extension (e.g., 'find all .py files')\n• Get largest files (e.g., 'show me the largest files')\n• Create a folder (e.g., 'create folder my_project')\n• List directory contents (e.g., 'list current directory')")
 
-            return jsonify({
+            return fastjson({
                 'response': help_text,
                 'action': 'help',
                 'error': action_info.get('error')
             })
 
         # This will be handled by /api/execute
-        return jsonify({
+        return fastjson({
             'response': f"I'll execute: {action_info['action']}",
             'action_info': action_info
         })
 
     except Exception as e:
-        return jsonify({
+        return fastjson({
             'error': str(e)
-        }), 500
+        }, 500)
+
+
+def run_action(action: str, params: Dict[str, Any],
+               on_file: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+    """
+    Run a file operation and build its API response body.
+
+    Args:
+        action: Action name (e.g., 'find_by_extension')
+        params: Action parameters
+        on_file: Optional callback for files as they are found (find_by_extension only)
+
+    Returns:
+        Response dictionary with success, data and message
+    """
+    if action == 'find_by_extension':
+        # Convert limit to int if it's a string (from LLM)
+        limit = params.get('limit', 50)
+        limit = int(limit) if isinstance(limit, str) else limit
+
+        result = FileOperations.find_files_by_extension(
+            params.get('directory', BASE_PATH),
+            params.get('extension', '.txt'),
+            limit,
+            on_file
+        )
+        return {
+            'success': True,
+            'data': result,
+            'message': f"Found {len(result)} files"
+        }
+
+    elif action == 'largest_files':
+        # Convert limit to int if it's a string (from LLM)
+        limit = params.get('limit', 10)
+        limit = int(limit) if isinstance(limit, str) else limit
+
+        result = FileOperations.get_largest_files(
+            params.get('directory', BASE_PATH),
+            limit
+        )
+        return {
+            'success': True,
+            'data': result,
+            'message': f"Found {len(result)} largest files"
+        }
+
+    elif action == 'create_folder':
+        result = FileOperations.create_folder(
+            params.get('directory', BASE_PATH),
+            params.get('folder_name', 'new_folder')
+        )
+        return {
+            'success': result['success'],
+            'data': result,
+            'message': result['message']
+        }
+
+    elif action == 'list_directory':
+        # Convert offset/limit to int if they're strings (from LLM)
+        offset = params.get('offset', 0)
+        offset = int(offset) if isinstance(offset, str) else offset
+        limit = params.get('limit', 200)
+        limit = int(limit) if isinstance(limit, str) else limit
+
+        result = FileOperations.list_directory(
+            params.get('directory', BASE_PATH),
+            offset,
+            limit
+        )
+
+        message = f"Listed {len(result['items'])} items"
+        if len(result['items']) < result['total']:
+            message = f"Listed {len(result['items'])} of {result['total']} items"
+
+        return {
+            'success': True,
+            'data': result,
+            'message': message
+        }
+
+    elif action == 'move_files':
+        result = FileOperations.move_files(
+            params.get('source_directory'),
+            params.get('destination_directory'),
+            params.get('pattern')
+        )
+        return {
+            'success': result['success'],
+            'data': result,
+            'message': result['message']
+        }
+
+    elif action == 'find_duplicates':
+        # Convert min_size to int if it's a string (from LLM)
+        min_size = params.get('min_size', 102400)
+        min_size = int(min_size) if isinstance(min_size, str) else min_size
+
+        result = FileOperations.find_duplicates(
+            params.get('directory', BASE_PATH),
+            min_size
+        )
+        return {
+            'success': result['success'],
+            'data': result,
+            'message': result['message']
+        }
+
+    raise UnknownActionError(f'Unknown action: {action}')
 
 
 @app.route('/api/execute', methods=['POST'])
@@ -720,7 +1309,8 @@ def execute():
     Request body:
         {
             "action": "find_by_extension",
-            "params": { ... }
+            "params": { ... },
+            "background": false  # optional, run as a background job
         }
 
     Returns:
@@ -729,114 +1319,189 @@ def execute():
             "data": { ... },
             "message": "operation result"
         }
+
+        or, for background jobs (HTTP 202):
+        {
+            "success": true,
+            "job_id": "..."
+        }
     """
     try:
         data = request.get_json()
 
         if not data or 'action' not in data:
-            return jsonify({
+            return fastjson({
                 'error': 'Missing action in request body'
-            }), 400
+            }, 400)
 
         action = data['action']
         params = data.get('params', {})
 
-        # Execute the appropriate operation
-        if action == 'find_by_extension':
-            # Convert limit to int if it's a string (from LLM)
-            limit = params.get('limit', 50)
-            limit = int(limit) if isinstance(limit, str) else limit
-
-            result = FileOperations.find_files_by_extension(
-                params.get('directory', BASE_PATH),
-                params.get('extension', '.txt'),
-                limit
-            )
-            return jsonify({
+        if data.get('background'):
+            job_id = _start_job(action, params)
+            if job_id is None:
+                return fastjson({
+                    'error': 'Too many background jobs, try again later',
+                    'success': False
+                }, 429)
+
+            return fastjson({
                 'success': True,
-                'data': result,
-                'message': f"Found {len(result)} files"
-            })
+                'job_id': job_id
+            }, 202)
 
-        elif action == 'largest_files':
-            # Convert limit to int if it's a string (from LLM)
-            limit = params.get('limit', 10)
-            limit = int(limit) if isinstance(limit, str) else limit
+        return fastjson(run_action(action, params))
 
-            result = FileOperations.get_largest_files(
-                params.get('directory', BASE_PATH),
-                limit
-            )
-            return jsonify({
-                'success': True,
-                'data': result,
-                'message': f"Found {len(result)} largest files"
-            })
+    except UnknownActionError as e:
+        return fastjson({
+            'error': str(e)
+        }, 400)
 
-        elif action == 'create_folder':
-            result = FileOperations.create_folder(
-                params.get('directory', BASE_PATH),
-                params.get('folder_name', 'new_folder')
-            )
-            return jsonify({
-                'success': result['success'],
-                'data': result,
-                'message': result['message']
-            })
+    except Exception as e:
+        return fastjson({
+            'error': str(e),
+            'success': False
+        }, 500)
 
-        elif action == 'list_directory':
-            result = FileOperations.list_directory(
-                params.get('directory', BASE_PATH)
-            )
-            return jsonify({
-                'success': True,
-                'data': result,
-                'message': f"Listed {len(result['items'])} items"
-            })
 
-        elif action == 'move_files':
-            result = FileOperations.move_files(
-                params.get('source_directory'),
-                params.get('destination_directory'),
-                params.get('pattern')
-            )
-            return jsonify({
-                'success': result['success'],
-                'data': result,
-                'message': result['message']
-            })
+def _start_job(action: str, params: Dict[str, Any]) -> Optional[str]:
+    """
+    Submit an action as a background job.
 
-        elif action == 'find_duplicates':
-            # Convert min_size to int if it's a string (from LLM)
-            min_size = params.get('min_size', 102400)
-            min_size = int(min_size) if isinstance(min_size, str) else min_size
-
-            result = FileOperations.find_duplicates(
-                params.get('directory', BASE_PATH),
-                min_size
-            )
-            return jsonify({
-                'success': result['success'],
-                'data': result,
-                'message': result['message']
-            })
+    Finished jobs nobody fetched within JOB_TTL seconds are dropped first.
 
-        else:
-            return jsonify({
-                'error': f'Unknown action: {action}'
-            }), 400
+    Returns:
+        The new job id, or None if JOB_LIMIT jobs are still held
+    """
+    now = time.monotonic()
+    with JOBS_LOCK:
+        for job_id, job in list(JOBS.items()):
+            finished = job['finished']
+            if finished is not None and now - finished > JOB_TTL:
+                del JOBS[job_id]
+
+        if len(JOBS) >= JOB_LIMIT:
+            return None
+
+        job_id = uuid.uuid4().hex
+        events = queue.Queue()
+        job = {'events': events, 'finished': None, 'streaming': False}
+
+        def mark_finished(_: Future) -> None:
+            job['finished'] = time.monotonic()
 
+        job['future'] = JOB_EXECUTOR.submit(run_action, action, params, events.put)
+        job['future'].add_done_callback(mark_finished)
+        JOBS[job_id] = job
+
+    return job_id
+
+
+def _job_response(future: Future) -> Tuple[Dict[str, Any], int]:
+    """Build the response body and status code for a finished job."""
+    try:
+        return {'status': 'done', **future.result()}, 200
+    except UnknownActionError as e:
+        return {'status': 'error', 'error': str(e)}, 400
     except Exception as e:
-        return jsonify({
-            'error': str(e),
-            'success': False
-        }), 500
+        return {'status': 'error', 'error': str(e), 'success': False}, 500
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id: str):
+    """
+    Poll a background job started via /api/execute.
+
+    Returns {"status": "running"} until the job finishes, then the same body
+    /api/execute would have returned, with "status": "done". Finished jobs
+    are forgotten once their result has been delivered, or after JOB_TTL
+    seconds if nobody fetches them.
+    """
+    with JOBS_LOCK:
+        job = JOBS.get(job_id)
+        if job is not None and job['future'].done():
+            JOBS.pop(job_id)
+
+    if job is None:
+        return fastjson({
+            'error': f'Unknown job: {job_id}'
+        }, 404)
+
+    if not job['future'].done():
+        return fastjson({
+            'job_id': job_id,
+            'status': 'running'
+        })
+
+    body, status = _job_response(job['future'])
+    return fastjson(body, status)
+
+
+@app.route('/api/jobs/<job_id>/stream', methods=['GET'])
+def job_stream(job_id: str):
+    """
+    Stream a background job's progress as newline-delimited JSON.
+
+    Emits {"type": "file", "data": {...}} for each file as it is found
+    (find_by_extension), then a final {"type": "result", ...} line with the
+    same body /api/jobs/<job_id> returns.
+
+    Each job can be streamed by one client only, since events are consumed
+    as they are sent; a second stream request gets 409.
+    """
+    with JOBS_LOCK:
+        job = JOBS.get(job_id)
+        streaming = job is not None and job['streaming']
+        if job is not None:
+            job['streaming'] = True
+
+    if job is None:
+        return fastjson({
+            'error': f'Unknown job: {job_id}'
+        }, 404)
+
+    if streaming:
+        return fastjson({
+            'error': f'Job {job_id} is already being streamed'
+        }, 409)
+
+    def generate():
+        future = job['future']
+        events = job['events']
+
+        while True:
+            try:
+                item = events.get(timeout=0.5)
+            except queue.Empty:
+                # Nothing more can be queued once the job has finished
+                if future.done() and events.empty():
+                    break
+                continue
+            yield dumps_json({'type': 'file', 'data': item}) + b'\n'
+
+        with JOBS_LOCK:
+            JOBS.pop(job_id, None)
+        body, _ = _job_response(future)
+        yield dumps_json({'type': 'result', **body}) + b'\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+@app.route('/api/cache/clear', methods=['POST'])
+def clear_cache():
+    """Clear the memoized LLM tool-call resolutions and directory listings (development helper)."""
+    AgentProcessor._resolve_tool_call.cache_clear()
+    FileOperations._clear_dir_cache()
+    return fastjson({
+        'success': True,
+        'message': 'Cache cleared'
+    })
 
 
 @app.route('/api/health', methods=['GET'])
 def health():
     """Health check endpoint."""
-    return jsonify({
+    return fastjson({
         'status': 'healthy',
         'version': '1.0.0',
         'base_path': BASE_PATH
@@ -846,13 +1511,16 @@ def health():
 @app.route('/', methods=['GET'])
 def index():
     """Root endpoint - API information."""
-    return jsonify({
+    return fastjson({
         'name': 'Local File Manager Agent API',
         'version': '1.0.0',
         'endpoints': {
             '/api/chat': 'POST - Natural language chat interface',
             '/api/execute': 'POST - Execute file operations',
-            '/api/health': 'GET - Health check'
+            '/api/jobs/<job_id>': 'GET - Poll a background job',
+            '/api/jobs/<job_id>/stream': 'GET - Stream a background job as JSON lines',
+            '/api/health': 'GET - Health check',
+            '/api/cache/clear': 'POST - Clear cached LLM tool calls and directory listings'
         }
     })
 
@@ -863,4 +1531,9 @@ if __name__ == '__main__':
     print(f"🤖 AI Model: {OLLAMA_MODEL} (with function calling)")
     print("🌐 Server running on http://localhost:5001")
     print("\n✨ LLM-powered intelligent file operations enabled!")
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    if os.environ.get('FLASK_DEBUG') == '1':
+        # Debugger only; the reloader would stat every imported module on a timer
+        app.run(debug=True, use_reloader=False, threaded=True, host='0.0.0.0', port=5001)
+    else:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5001, threads=16)